@@ -0,0 +1,22 @@
+# Numeric CSV loader shared by the PC scripts: pandas' C parser when installed, else np.loadtxt
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+def load_csv(csv_in):
+    """
+    Read a float CSV with a one-line header into a 2-D (rows, columns) array.
+
+    Single-row and header-only files keep their column count on both paths.
+    pandas uses round_trip parsing so its values match np.loadtxt bit for bit.
+    """
+    if pd is not None:
+        return pd.read_csv(csv_in, header=0, dtype=np.float64, engine="c",
+                           float_precision="round_trip").to_numpy()
+    with open(csv_in) as f:
+        ncols = len(f.readline().split(","))
+        arr = np.loadtxt(f, delimiter=",", dtype=np.float64, ndmin=2)
+    return arr.reshape(-1, ncols)
@@ -0,0 +1,16 @@
+# Indented JSON encoder shared by the PC scripts: orjson when installed, else the stdlib.
+#
+# The two are NOT byte-identical for every input:
+# - float spelling can differ for very small/large values (1e-05 vs 0.00001, 1e+16 vs 1e16)
+# - non-finite floats: the stdlib writes NaN/Infinity (not valid JSON), orjson writes null,
+#   so validate inputs upstream rather than relying on either encoder to catch them
+# Strings match: the fallback keeps non-ASCII as raw UTF-8 like orjson.
+import json
+
+try:
+    import orjson
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
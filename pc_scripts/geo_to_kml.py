@@ -1,5 +1,8 @@
 # Quick 3D preview KML from lat,lon,alt CSV
 import sys
+import numpy as np
+
+from csvload import load_csv
 
 TPL = """<?xml version="1.0" encoding="UTF-8"?>
 <kml xmlns="http://www.opengis.net/kml/2.2">
@@ -16,18 +19,15 @@ TPL = """<?xml version="1.0" encoding="UTF-8"?>
   </Placemark>
 </Document>
 </kml>"""
+# Split around the coordinate block so the vertices can be streamed straight to the file
+TPL_HEAD, TPL_TAIL = TPL.split("        {coords}\n")
 
 if __name__ == "__main__":
     _, csv_in, kml_out = sys.argv
-    coords = []
-    with open(csv_in) as f:
-        header = f.readline()
-        for line in f:
-            if not line.strip():
-                continue
-            lat,lon,alt = [float(x) for x in line.strip().split(",")]
-            coords.append(f"{lon},{lat},{alt}")
-    xml = TPL.format(coords="\n        ".join(coords))
+    arr = load_csv(csv_in)  # lat,lon,alt
     with open(kml_out, "w") as f:
-        f.write(xml)
-    print(f"Wrote {len(coords)} vertices to {kml_out}")
+        f.write(TPL_HEAD)
+        # KML wants lon,lat,alt; let NumPy's C writer do the per-row formatting
+        np.savetxt(f, arr[:, [1, 0, 2]], fmt="        %.7f,%.7f,%.2f")
+        f.write(TPL_TAIL)
+    print(f"Wrote {len(arr)} vertices to {kml_out}")
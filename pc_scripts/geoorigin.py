@@ -0,0 +1,13 @@
+# Flat-earth ENU <-> lat/lon origin shared by local_to_geo.py and svg_to_basic_wpl.py
+import math
+from collections import namedtuple
+
+EARTH_RADIUS_M = 6378137.0  # WGS84
+
+# Origin terms precomputed once, so per-point ENU->LL is two multiplies (no division, no trig)
+GeoOrigin = namedtuple("GeoOrigin", "lat0_rad lon0_rad inv_R inv_R_cos_lat0")
+
+def geo_origin(lat0_deg, lon0_deg):
+    lat0 = math.radians(lat0_deg)
+    return GeoOrigin(lat0, math.radians(lon0_deg),
+                     1.0 / EARTH_RADIUS_M, 1.0 / (EARTH_RADIUS_M * math.cos(lat0)))
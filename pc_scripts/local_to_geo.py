@@ -2,44 +2,39 @@
 import numpy as np
 import math, sys
 
-R_EARTH = 6378137.0  # meters
+from csvload import load_csv
+from geoorigin import geo_origin
 
-def apply_scene_transform(xy_local, scale_m_per_svg, yaw_deg, offset_xy=(0,0)):
-    xy = xy_local * float(scale_m_per_svg)
+def apply_scene_transform(x_local, y_local, scale_m_per_svg, yaw_deg, offset_xy=(0,0)):
+    # 2x2 rotation written out per axis, with the scale folded into its four
+    # scalar coefficients: no matmul and no scaled x/y temporaries
     yaw = math.radians(yaw_deg)
-    R = np.array([[ math.cos(yaw), -math.sin(yaw)],
-                  [ math.sin(yaw),  math.cos(yaw)]])
-    xy = xy @ R.T
-    xy[:,0] += offset_xy[0]  # East
-    xy[:,1] += offset_xy[1]  # North
-    return xy
+    a = float(scale_m_per_svg) * math.cos(yaw)
+    b = float(scale_m_per_svg) * math.sin(yaw)
+    east  = x_local * a - y_local * b + offset_xy[0]
+    north = x_local * b + y_local * a + offset_xy[1]
+    return east, north
 
 def enu_to_ll(x_m_east, y_m_north, lat0_deg, lon0_deg):
-    lat0 = math.radians(lat0_deg)
-    dlat = y_m_north / R_EARTH
-    dlon = x_m_east / (R_EARTH * math.cos(lat0))
-    lat = lat0 + dlat
-    lon = math.radians(lon0_deg) + dlon
-    return math.degrees(lat), math.degrees(lon)
+    # Works on scalars or whole arrays of east/north offsets
+    o = geo_origin(lat0_deg, lon0_deg)
+    lat = o.lat0_rad + y_m_north * o.inv_R
+    lon = o.lon0_rad + x_m_east * o.inv_R_cos_lat0
+    return np.degrees(lat), np.degrees(lon)
 
 def convert(csv_in, csv_out, lat0, lon0, alt0, scale, yaw_deg, z_mode="REL", z_offset=0.0):
-    pts = np.loadtxt(csv_in, delimiter=",", skiprows=1)  # x_local,y_local,z_local
-    if pts.ndim == 1 and pts.size > 0:
-        pts = pts.reshape(1, -1)
-    xy_local = pts[:, :2]
-    z_local  = pts[:, 2] if pts.shape[1] > 2 else np.zeros(len(pts))
-    xy = apply_scene_transform(xy_local, scale, yaw_deg, (0,0))
-    lats, lons, alts = [], [], []
-    for (x_e, y_n), z in zip(xy, z_local):
-        lat, lon = enu_to_ll(x_e, y_n, lat0, lon0)
-        if z_mode.upper() == "AMSL":
-            alt = alt0 + z + z_offset
-        elif z_mode.upper() == "REL":
-            alt = z + z_offset  # relative altitude is handled by mission frame
-        else:
-            alt = alt0 + z + z_offset
-        lats.append(lat); lons.append(lon); alts.append(alt)
-    arr = np.vstack([lats,lons,alts]).T
+    pts = load_csv(csv_in)  # x_local,y_local,z_local
+    # Split into contiguous per-axis arrays (SoA) for the per-axis passes below
+    x_local = np.ascontiguousarray(pts[:, 0])
+    y_local = np.ascontiguousarray(pts[:, 1])
+    z_local = np.ascontiguousarray(pts[:, 2]) if pts.shape[1] > 2 else np.zeros(len(pts))
+    east, north = apply_scene_transform(x_local, y_local, scale, yaw_deg, (0,0))
+    lats, lons = enu_to_ll(east, north, lat0, lon0)
+    if z_mode.upper() == "REL":
+        alts = z_local + z_offset  # relative altitude is handled by mission frame
+    else:  # AMSL (and anything unrecognised)
+        alts = alt0 + z_local + z_offset
+    arr = np.column_stack([lats, lons, alts])
     np.savetxt(csv_out, arr, delimiter=",", header="lat,lon,alt", comments="")
     print(f"Saved {arr.shape[0]} geo points to {csv_out}")
 
@@ -1,14 +1,16 @@
 # Build a simple LED cue JSON by waypoint index ranges
-import json, sys
+import sys
+from pathlib import Path
+
+from fastjson import dumps
 
 if __name__ == "__main__":
     # Usage: python make_led_cues.py 0:25:#00A3FF:solid 26:60:#FF006E:blink cues.json
     *ranges, out = sys.argv[1:]
-    cues = []
-    for spec in ranges:
-        a,b,color,mode = spec.split(":")
-        cues.append({"from":int(a), "to":int(b), "color":color, "mode":mode})
+    # split(":", 3): from, to, color, mode (mode keeps any further ':')
+    cues = [{"from":int(a), "to":int(b), "color":color, "mode":mode}
+            for spec in ranges
+            for a,b,color,mode in [spec.split(":", 3)]]
     doc = {"global_defaults":{"mode":"solid","color":"#FFFFFF","brightness":0.5}, "cues":cues}
-    with open(out,"w") as f:
-        json.dump(doc,f,indent=2)
+    Path(out).write_bytes(dumps(doc))
     print(f"Wrote LED cues to {out}")
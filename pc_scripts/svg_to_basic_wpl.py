@@ -3,19 +3,30 @@ import math
 import sys
 from pathlib import Path
 
-from svgpathtools import svg2paths
+import numpy as np
+from svgpathtools import Arc, svg2paths
 
-EARTH_RADIUS_M = 6378137.0  # WGS84
+from fastjson import dumps
+from geoorigin import geo_origin
 
 
 def load_config(config_path):
     with open(config_path, "r") as f:
         cfg = json.load(f)
 
+    lat0_deg = float(cfg["first_wp_lat_deg"])
+    lon0_deg = float(cfg["first_wp_lon_deg"])
+    heading_deg = float(cfg.get("heading_deg", 0.0))
+    heading_rad = math.radians(heading_deg)
+
     return {
-        "lat0_deg": float(cfg["first_wp_lat_deg"]),
-        "lon0_deg": float(cfg["first_wp_lon_deg"]),
-        "heading_deg": float(cfg.get("heading_deg", 0.0)),
+        "lat0_deg": lat0_deg,
+        "lon0_deg": lon0_deg,
+        "origin": geo_origin(lat0_deg, lon0_deg),
+        "heading_deg": heading_deg,
+        # Heading is fixed for the whole mission: derive the rotation once
+        "cos_h": np.float64(math.cos(heading_rad)),
+        "sin_h": np.float64(math.sin(heading_rad)),
         "min_alt_m": float(cfg["min_alt_m"]),
         "max_alt_m": float(cfg["max_alt_m"]),
     }
@@ -38,16 +49,50 @@ def parse_style(style_str: str) -> dict:
     return out
 
 
-def choose_longest_path(paths):
-    """Fallback: pick the longest path."""
-    best = None
+def length_upper_bound(path):
+    """
+    Cheap upper bound on path.length(): the control-polygon length of each
+    Line/Bezier segment, and sweep angle * larger radius for arcs.
+    """
+    total = 0.0
+    for seg in path:
+        if isinstance(seg, Arc):
+            total += abs(math.radians(seg.delta)) * max(abs(seg.radius.real), abs(seg.radius.imag))
+        else:
+            bp = seg.bpoints()
+            total += sum(abs(b - a) for a, b in zip(bp[:-1], bp[1:]))
+    return total
+
+
+def choose_longest_path(paths, lengths=None):
+    """
+    Pick the longest path.
+
+    svgpathtools' length() integrates numerically, so paths are visited in
+    order of their cheap upper bound and the exact length is only computed
+    while a path could still beat the best one found so far. Exact lengths
+    are cached in `lengths` (keyed by id(path)) so callers can share them.
+    """
+    if lengths is None:
+        lengths = {}
+
+    bounds = [length_upper_bound(p) for p in paths]
+    order = sorted(range(len(paths)), key=lambda i: bounds[i], reverse=True)
+
+    best_i = None
     best_len = -1.0
-    for p in paths:
-        length = p.length()
-        if length > best_len:
+    for i in order:
+        if bounds[i] * (1 + 1e-9) < best_len:
+            break  # nothing left can be longer
+        key = id(paths[i])
+        if key not in lengths:
+            lengths[key] = paths[i].length()
+        length = lengths[key]
+        # ties go to the earliest path in the document
+        if length > best_len or (length == best_len and i < best_i):
             best_len = length
-            best = p
-    return best
+            best_i = i
+    return None if best_i is None else paths[best_i]
 
 
 def choose_flight_path(paths, attrs):
@@ -60,6 +105,7 @@ def choose_flight_path(paths, attrs):
     - Among those, pick the longest.
     - If none match, fall back to the overall longest path.
     """
+    lengths = {}  # exact lengths, shared with the fallback
     candidates = []
 
     for p, a in zip(paths, attrs):
@@ -73,14 +119,12 @@ def choose_flight_path(paths, attrs):
         no_fill = (fill in ("", "none"))
 
         if has_stroke and no_fill:
-            length = p.length()
-            candidates.append((length, p))
+            candidates.append(p)
 
     if candidates:
-        candidates.sort(key=lambda t: t[0], reverse=True)
-        return candidates[0][1]
+        return choose_longest_path(candidates, lengths)
 
-    return choose_longest_path(paths)
+    return choose_longest_path(paths, lengths)
 
 
 def extract_nodes(path):
@@ -128,12 +172,12 @@ def normalise_and_scale_wall(points, cfg):
     if len(points) < 2:
         raise ValueError("Need at least 2 points in path for scaling")
 
-    x0, y0 = points[0]
+    P = np.asarray(points, dtype=np.float64)
+    x0 = P[0, 0]
 
-    # Collect Y values to determine vertical span in the drawing
-    y_values = [p[1] for p in points]
-    y_min = min(y_values)  # top of drawing (smallest y)
-    y_max = max(y_values)  # bottom of drawing (largest y)
+    # Vertical span in the drawing
+    y_min = P[:, 1].min()  # top of drawing (smallest y)
+    y_max = P[:, 1].max()  # bottom of drawing (largest y)
 
     alt_min = cfg["min_alt_m"]
     alt_max = cfg["max_alt_m"]
@@ -142,24 +186,16 @@ def normalise_and_scale_wall(points, cfg):
     if abs(alt_range) < 1e-9:
         raise ValueError("min_alt_m and max_alt_m must be different")
 
+    # Heading rotation, precomputed by load_config
+    cos_h = cfg["cos_h"]
+    sin_h = cfg["sin_h"]
+
     if abs(y_max - y_min) < 1e-9:
         # All points have the same Y -> flat altitude at mid of range
-        alt_flat = 0.5 * (alt_min + alt_max)
         meters_per_svg = 1.0  # arbitrary; no true vertical scale
-
-        heading_rad = math.radians(cfg["heading_deg"])
-        cos_h = math.cos(heading_rad)
-        sin_h = math.sin(heading_rad)
-
-        en_points = []
-        alt_list = []
-        for (x, y) in points:
-            s_svg = x - x0
-            s_m = s_svg * meters_per_svg
-            east = s_m * cos_h
-            north = s_m * sin_h
-            en_points.append((east, north))
-            alt_list.append(alt_flat)
+        s_m = (P[:, 0] - x0) * meters_per_svg
+        en_points = np.column_stack([s_m * cos_h, s_m * sin_h])
+        alt_list = np.full(len(P), 0.5 * (alt_min + alt_max))
         return en_points, alt_list
 
     # Compute meters per SVG unit from vertical span:
@@ -168,29 +204,15 @@ def normalise_and_scale_wall(points, cfg):
     # so |y_max - y_min| SVG units correspond to |alt_range| meters
     meters_per_svg = abs(alt_range) / abs(y_max - y_min)
 
-    # Precompute heading rotation
-    heading_rad = math.radians(cfg["heading_deg"])
-    cos_h = math.cos(heading_rad)
-    sin_h = math.sin(heading_rad)
+    # Horizontal ground distance: along X (+right on paper)
+    s_m = (P[:, 0] - x0) * meters_per_svg
+    en_points = np.column_stack([s_m * cos_h, s_m * sin_h])
 
-    en_points = []
-    alt_list = []
-
-    for (x, y) in points:
-        # Horizontal ground distance: along X
-        s_svg = x - x0            # +right on paper
-        s_m = s_svg * meters_per_svg
-
-        east = s_m * cos_h
-        north = s_m * sin_h
-        en_points.append((east, north))
-
-        # Vertical mapping:
-        # y_max (bottom on page) -> alt_min
-        # y_min (top on page)    -> alt_max
-        t = (y_max - y) / (y_max - y_min)  # 0 at y = y_max, 1 at y = y_min
-        alt = alt_min + t * alt_range
-        alt_list.append(alt)
+    # Vertical mapping:
+    # y_max (bottom on page) -> alt_min
+    # y_min (top on page)    -> alt_max
+    t = (y_max - P[:, 1]) / (y_max - y_min)  # 0 at y = y_max, 1 at y = y_min
+    alt_list = alt_min + t * alt_range
 
     return en_points, alt_list
 
@@ -198,20 +220,16 @@ def normalise_and_scale_wall(points, cfg):
 def en_to_latlon(cfg, en_points):
     """
     Convert (east_m, north_m) offsets to lat/lon using local flat-earth approx.
-    """
-    lat0 = math.radians(cfg["lat0_deg"])
-    lon0 = math.radians(cfg["lon0_deg"])
 
-    out = []
-    for (east, north) in en_points:
-        dlat = north / EARTH_RADIUS_M
-        dlon = east / (EARTH_RADIUS_M * math.cos(lat0))
+    Returns an (N, 2) array of (lat_deg, lon_deg).
+    """
+    en = np.asarray(en_points, dtype=np.float64).reshape(-1, 2)
+    o = cfg["origin"]
 
-        lat = lat0 + dlat
-        lon = lon0 + dlon
+    dlat = en[:, 1] * o.inv_R
+    dlon = en[:, 0] * o.inv_R_cos_lat0
 
-        out.append((math.degrees(lat), math.degrees(lon)))
-    return out
+    return np.column_stack([np.degrees(o.lat0_rad + dlat), np.degrees(o.lon0_rad + dlon)])
 
 def write_led_template(path_out, num_pattern_points):
     """
@@ -234,8 +252,7 @@ def write_led_template(path_out, num_pattern_points):
             # Pattern waypoints: blank -> Pi script should 'do nothing'
             data[str(i)] = ""
 
-    import json
-    Path(path_out).write_text(json.dumps(data, indent=2), encoding="utf-8")
+    Path(path_out).write_bytes(dumps(data))
     print(f"Wrote LED template for {total_wp} waypoints to {path_out}")
 
 
@@ -246,69 +263,40 @@ def write_wpl(path_out, cfg, latlon_points, alt_list):
       1..N: NAV_WAYPOINT from the drawing
       N+1: LAND at home
     """
-    lines = ["QGC WPL 110"]
+    n = len(latlon_points)
 
     lat_home = cfg["lat0_deg"]
     lon_home = cfg["lon0_deg"]
 
-    # --- 0: TAKEOFF at home ---
     # Use altitude of the first drawing waypoint as target takeoff altitude
-    takeoff_alt = alt_list[0] if alt_list else cfg["min_alt_m"]
-
-    index = 0
-    current = 1              # start here
-    coord_frame = 3          # MAV_FRAME_GLOBAL_RELATIVE_ALT
-    command = 22             # MAV_CMD_NAV_TAKEOFF
-    p1 = 0                   # pitch, leave 0
-    p2 = 0
-    p3 = 0
-    p4 = 0
-    autocontinue = 1
-
-    lines.append(
-        f"{index}\t{current}\t{coord_frame}\t{command}\t"
-        f"{p1}\t{p2}\t{p3}\t{p4}\t"
-        f"{lat_home:.7f}\t{lon_home:.7f}\t{takeoff_alt:.2f}\t{autocontinue}"
-    )
+    takeoff_alt = alt_list[0] if len(alt_list) else cfg["min_alt_m"]
+    land_alt = cfg["min_alt_m"]   # usually ignored by LAND, but set anyway
+
+    # One row per waypoint, columns:
+    # index, current, frame, command, p1..p4, lat, lon, alt, autocontinue
+    rows = np.zeros((n + 2, 12), dtype=np.float64)
+    rows[:, 0] = np.arange(n + 2)
+    rows[:, 2] = 3             # MAV_FRAME_GLOBAL_RELATIVE_ALT
+    rows[:, 11] = 1            # autocontinue
+    # p1..p4 stay 0 (TAKEOFF pitch included)
+
+    # --- 0: TAKEOFF at home ---
+    rows[0, 1] = 1             # current: start here
+    rows[0, 3] = 22            # MAV_CMD_NAV_TAKEOFF
+    rows[0, 8:11] = (lat_home, lon_home, takeoff_alt)
 
     # --- 1..N: drawing waypoints ---
-    for i, ((lat, lon), alt) in enumerate(zip(latlon_points, alt_list), start=1):
-        index = i
-        current = 0
-        coord_frame = 3        # MAV_FRAME_GLOBAL_RELATIVE_ALT
-        command = 16           # MAV_CMD_NAV_WAYPOINT
-        p1 = 0
-        p2 = 0
-        p3 = 0
-        p4 = 0
-        autocontinue = 1
-
-        lines.append(
-            f"{index}\t{current}\t{coord_frame}\t{command}\t"
-            f"{p1}\t{p2}\t{p3}\t{p4}\t"
-            f"{lat:.7f}\t{lon:.7f}\t{alt:.2f}\t{autocontinue}"
-        )
+    rows[1:-1, 3] = 16         # MAV_CMD_NAV_WAYPOINT
+    rows[1:-1, 8:10] = np.asarray(latlon_points, dtype=np.float64).reshape(-1, 2)
+    rows[1:-1, 10] = alt_list
 
     # --- N+1: LAND at home ---
-    land_index = len(latlon_points) + 1
-    index = land_index
-    current = 0
-    coord_frame = 3            # MAV_FRAME_GLOBAL_RELATIVE_ALT
-    command = 21               # MAV_CMD_NAV_LAND
-    p1 = 0
-    p2 = 0
-    p3 = 0
-    p4 = 0
-    land_alt = cfg["min_alt_m"]   # usually ignored by LAND, but set anyway
-    autocontinue = 1
-
-    lines.append(
-        f"{index}\t{current}\t{coord_frame}\t{command}\t"
-        f"{p1}\t{p2}\t{p3}\t{p4}\t"
-        f"{lat_home:.7f}\t{lon_home:.7f}\t{land_alt:.2f}\t{autocontinue}"
-    )
+    rows[-1, 3] = 21           # MAV_CMD_NAV_LAND
+    rows[-1, 8:11] = (lat_home, lon_home, land_alt)
 
-    Path(path_out).write_text("\n".join(lines), encoding="utf-8")
+    np.savetxt(path_out, rows,
+               fmt=["%d"] * 8 + ["%.7f", "%.7f", "%.2f", "%d"],
+               delimiter="\t", header="QGC WPL 110", comments="")
     print(f"Wrote {len(latlon_points)} pattern waypoints (+ TAKEOFF & LAND) to {path_out}")
 
 
@@ -1,38 +1,83 @@
 # pip install svgpathtools numpy
-from svgpathtools import svg2paths2
+from svgpathtools import svg2paths2, Line, QuadraticBezier, CubicBezier, Arc
 import numpy as np
 import sys
 
-def sample_path(path, step_m_local):
+def eval_segment(seg, t):
+    # Evaluate one segment at an array of local t in [0, 1] (complex result)
+    if isinstance(seg, Line):
+        return seg.start + (seg.end - seg.start) * t
+    if isinstance(seg, QuadraticBezier):
+        p0, p1, p2 = seg.bpoints()
+        u = 1 - t
+        return u*u*p0 + 2*u*t*p1 + t*t*p2
+    if isinstance(seg, CubicBezier):
+        p0, p1, p2, p3 = seg.bpoints()
+        u = 1 - t
+        return u*u*u*p0 + 3*u*u*t*p1 + 3*u*t*t*p2 + t*t*t*p3
+    if isinstance(seg, Arc):
+        return seg.point(t)  # svgpathtools' Arc.point uses numpy trig, so it broadcasts
+    return np.array([seg.point(ti) for ti in t], dtype=complex)
+
+def sample_count(path, step_m_local):
+    # Number of rows sample_path returns (0 for a zero-length path)
     L = path.length()
     if L == 0:
+        return 0
+    return max(1, int(np.ceil(L / step_m_local))) + 1
+
+def sample_path(path, step_m_local, out=None):
+    # Returns (n, 2) x,y samples; written into out[:n] when a buffer is given
+    n = sample_count(path, step_m_local)
+    if n == 0:
         return []
-    n = max(1, int(np.ceil(L / step_m_local)))
-    ts = np.linspace(0, 1, n+1)
-    pts = [path.point(t) for t in ts]
-    return np.array([[p.real, p.imag] for p in pts], dtype=float)
+    L = path.length()
+    ts = np.linspace(0, 1, n)
+    # Map global t -> (segment, local t) via the cumulative length table, like Path.point
+    fracs = np.array([seg.length() for seg in path]) / L
+    ends = np.cumsum(fracs)
+    starts = ends - fracs
+    idx = np.minimum(np.searchsorted(ends, ts), len(path) - 1)
+    local = np.divide(ts - starts[idx], fracs[idx], out=np.zeros_like(ts), where=fracs[idx] > 0)
+    idx[0], local[0] = 0, 0.0
+    idx[-1], local[-1] = len(path) - 1, 1.0
+    pts = np.empty(len(ts), dtype=complex)
+    for i in np.unique(idx):
+        sel = idx == i
+        pts[sel] = eval_segment(path[i], local[sel])
+    if out is None:
+        out = np.empty((n, 2), dtype=np.float64)
+    out[:n, 0] = pts.real
+    out[:n, 1] = pts.imag
+    return out[:n]
 
-def svg_to_local_points(svg_file, step_m_local=1.0, z_local=0.0):
+def iter_subpaths(svg_file):
     paths, attrs, svg_attr = svg2paths2(svg_file)
-    all_pts = []
     for p in paths:
         try:
             segments = p.continuous_subpaths()
         except:
             segments = [p]
-        for s in segments:
-            pts2d = sample_path(s, step_m_local)
-            if len(pts2d) == 0:
+        yield from segments
+
+def write_local_points(svg_file, csv_out, step_m_local=1.0, z_local=0.0):
+    # Stream each subpath to the CSV. Every subpath is sampled straight into
+    # one reused (max_n, 3) buffer whose z column is filled once.
+    subpaths = list(iter_subpaths(svg_file))
+    counts = [sample_count(s, step_m_local) for s in subpaths]
+    buf = np.empty((max(counts, default=0), 3), dtype=np.float64)
+    buf[:, 2] = float(z_local)
+    with open(csv_out, "w") as fh:
+        fh.write("x_local,y_local,z_local\n")
+        for s, n in zip(subpaths, counts):
+            if n == 0:
                 continue
-            zcol = np.full((pts2d.shape[0],1), float(z_local))
-            all_pts.append(np.hstack([pts2d, zcol]))
-    if not all_pts:
-        return np.zeros((0,3))
-    return np.vstack(all_pts)
+            sample_path(s, step_m_local, out=buf[:, :2])
+            np.savetxt(fh, buf[:n], fmt="%.6f", delimiter=",")
+    return sum(counts)
 
 if __name__ == "__main__":
     svg = sys.argv[1]
     step = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
-    pts = svg_to_local_points(svg, step_m_local=step, z_local=0.0)
-    np.savetxt("local_points.csv", pts, delimiter=",", header="x_local,y_local,z_local", comments="")
-    print(f"Saved {pts.shape[0]} points to local_points.csv")
+    n = write_local_points(svg, "local_points.csv", step_m_local=step, z_local=0.0)
+    print(f"Saved {n} points to local_points.csv")
@@ -2,39 +2,9 @@
 import sys
 import time
 
-import board
-import neopixel
+from led_colors import COLOR_MAP, LED_COUNT, open_strip
 
-# ===== CONFIG =====
-LED_PIN = board.D18        # GPIO18 (physical pin 12)
-LED_COUNT = 25             # First 25 LEDs
-BRIGHTNESS = 1.0           # 0.0 - 1.0
-# ===================
-
-COLOR_MAP = {
-    "red":        (255,   0,   0),
-    "green":      (  0, 255,   0),
-    "blue":       (  0,   0, 255),
-    "brown":      (255, 100,  20),
-    "white":      (255, 255, 255),
-    "yellow":     (255, 255,   0),
-    "cyan":       (  0, 255, 255),
-    "magenta":    (255,   0, 255),
-    "orange":     (255, 165,   0),
-    "purple":     (128,   0, 128),
-    "pink":       (255, 105, 180),
-    "warmwhite":  (255, 244, 229),
-    "coldwhite":  (200, 220, 255),
-    "off":        (  0,   0,   0),
-}
-
-pixels = neopixel.NeoPixel(
-    LED_PIN,
-    LED_COUNT,
-    brightness=BRIGHTNESS,
-    auto_write=False,
-    pixel_order=neopixel.GRB,
-)
+pixels = open_strip()
 
 def set_all(color):
     for i in range(LED_COUNT):
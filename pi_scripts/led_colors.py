@@ -0,0 +1,37 @@
+# NeoPixel strip config and color names shared by led25.py and
+# mission_led_runtime.py (add new colors here)
+import board
+import neopixel
+
+# ===== CONFIG =====
+LED_PIN = board.D18        # GPIO18 (physical pin 12)
+LED_COUNT = 25             # First 25 LEDs
+BRIGHTNESS = 1.0           # 0.0 - 1.0
+# ===================
+
+COLOR_MAP = {
+    "red":        (255,   0,   0),
+    "green":      (  0, 255,   0),
+    "blue":       (  0,   0, 255),
+    "brown":      (255, 100,  20),
+    "white":      (255, 255, 255),
+    "yellow":     (255, 255,   0),
+    "cyan":       (  0, 255, 255),
+    "magenta":    (255,   0, 255),
+    "orange":     (255, 165,   0),
+    "purple":     (128,   0, 128),
+    "pink":       (255, 105, 180),
+    "warmwhite":  (255, 244, 229),
+    "coldwhite":  (200, 220, 255),
+    "off":        (  0,   0,   0),
+}
+
+def open_strip():
+    """Open the NeoPixel strip (call once and keep the object)."""
+    return neopixel.NeoPixel(
+        LED_PIN,
+        LED_COUNT,
+        brightness=BRIGHTNESS,
+        auto_write=False,
+        pixel_order=neopixel.GRB,
+    )
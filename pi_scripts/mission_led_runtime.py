@@ -7,8 +7,10 @@ Interactive LED controller for real missions:
 1. Lists all .led.json LED plans in /home/led_plans
 2. Asks you which one to use
 3. Listens on UDP port 14550 for MAVLink (Mission Planner forwarding)
-4. Watches MISSION_CURRENT and calls /home/led25.py
-   whenever a waypoint has a non-blank LED command.
+4. Watches MISSION_CURRENT and sets the NeoPixels directly (the strip is
+   opened once at startup) whenever a waypoint has a non-blank LED command.
+
+Needs root for NeoPixel access (sudo), and led_colors.py next to this script.
 
 JSON file format (example):
 
@@ -25,16 +27,16 @@ Rules:
 - key  = waypoint index (0..N+1)
 - val  = ""      -> NO CHANGE (keep current LED color)
 - val  = "off"   -> turn LEDs off
-- val  = "red"... -> set that color (must match led25.py COLOR_MAP keys)
+- val  = "red"... -> set that color (must match led_colors.py COLOR_MAP keys)
 """
 
 import json
-import time
-import subprocess
 from pathlib import Path
 
 from pymavlink import mavutil
 
+from led_colors import COLOR_MAP, open_strip
+
 
 # ====== CONFIG ======
 
@@ -43,8 +45,7 @@ LED_PLANS_DIR = Path("/home/led_plans")
 # LISTEN on UDP port 14550 for MAVLink forwarded from Mission Planner
 MAVLINK_CONNECTION = "udpin:0.0.0.0:14550"
 
-# Path to the low-level LED driver script
-LED25_PATH = "/home/led25.py"
+# NeoPixel wiring (pin, count, brightness) lives in led_colors.py
 
 # ====================
 
@@ -117,16 +118,18 @@ def get_led_command(led_cfg: dict, wp_index: int):
     return val.lower()
 
 
-def set_all_leds(color_name: str):
-    """Call led25.py with the given color name."""
+def set_all_leds(pixels, color_name: str):
+    """Set the whole strip to the given color name."""
+    color = COLOR_MAP.get(color_name)
+    if color is None:
+        print(f"[LED] Unknown color '{color_name}', ignoring")
+        return
     print(f"[LED] Setting LEDs: {color_name}")
     try:
-        subprocess.run(
-            ["sudo", "python3", LED25_PATH, color_name],
-            check=False
-        )
+        pixels.fill(color)
+        pixels.show()
     except Exception as e:
-        print(f"[LED] Error running led25.py: {e}")
+        print(f"[LED] Error setting LEDs: {e}")
 
 
 def main():
@@ -138,34 +141,39 @@ def main():
         print("[LED] Empty config, nothing to do.")
         return
 
-    # 2) Connect to MAVLink (listen for UDP from Mission Planner)
+    # 2) Open the LED strip once and keep it, so a color change is a fill + show,
+    #    not a fresh python3 process re-importing board/neopixel
+    pixels = open_strip()
+
+    # 3) Connect to MAVLink (listen for UDP from Mission Planner)
     print(f"[MAV] Connecting (listening) on {MAVLINK_CONNECTION} ...")
     mav = mavutil.mavlink_connection(MAVLINK_CONNECTION)
 
     current_wp = None
     current_color = None
     heartbeat_seen = False
+    # recv_match still decodes every message, but only returns these types, so
+    # the loop below wakes just for them. HEARTBEAT is only wanted until the
+    # first one arrives.
+    wanted = ["HEARTBEAT", "MISSION_CURRENT"]
 
     print("[MAV] Waiting for MAVLink messages (HEARTBEAT / MISSION_CURRENT)...")
 
     while True:
-        msg = mav.recv_match(blocking=True, timeout=5)
+        msg = mav.recv_match(type=wanted, blocking=True, timeout=5)
 
         if msg is None:
-            print("[MAV] No message for 5s, still listening...")
+            if heartbeat_seen:
+                print("[MAV] No MISSION_CURRENT for 5s, still listening...")
+            else:
+                print("[MAV] No HEARTBEAT / MISSION_CURRENT for 5s, still listening...")
             continue
 
-        mtype = msg.get_type()
-
-        # Debug: show first few message types
-        if not heartbeat_seen and mtype == "HEARTBEAT":
-            heartbeat_seen = True
-            print(f"[MAV] HEARTBEAT received from sys {msg.get_srcSystem()} comp {msg.get_srcComponent()}")
-
-        # Only react to MISSION_CURRENT
-        if mtype != "MISSION_CURRENT":
-            # Uncomment the next line if you want to see everything:
-            # print("[MAV] Got:", mtype)
+        if msg.get_type() == "HEARTBEAT":
+            if not heartbeat_seen:
+                heartbeat_seen = True
+                wanted = "MISSION_CURRENT"
+                print(f"[MAV] HEARTBEAT received from sys {msg.get_srcSystem()} comp {msg.get_srcComponent()}")
             continue
 
         wp = int(msg.seq)
@@ -186,11 +194,9 @@ def main():
             print("[LED] Command same as current color, skipping.")
             continue
 
-        set_all_leds(cmd)
+        set_all_leds(pixels, cmd)
         current_color = cmd
 
-        time.sleep(0.1)
-
 
 if __name__ == "__main__":
     main()